@@ -18,7 +18,9 @@ def tests(session: Session) -> None:
     """Run the test suite."""
     args = session.posargs or ["--cov"]
     session.install(".")
-    session.install("coverage[toml]", "pytest", "pytest-cov", "pytest-mock")
+    session.install(
+        "coverage[toml]", "pytest", "pytest-cov", "pytest-mock", "pytest-xdist"
+    )
     session.run("pytest", *args)
 
 
@@ -16,8 +16,8 @@ Example:
 """
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Dict, Optional, Union
+from datetime import date, datetime
+from typing import Dict, Optional, Tuple, Union
 
 from rdflib import BNode, Graph, Literal, Namespace, RDF
 from rdflib.term import Identifier
@@ -50,11 +50,31 @@ class Date(str):
     def _is_valid_date(self: Date, date: str) -> None:
         """Perform basic validation of str as date."""
         try:
-            _ = datetime.strptime(date, "%Y-%m-%d")
+            _ = _parse_date(date)
         except ValueError as e:
             raise InvalidDateError(date, "String is not a valid date") from e
 
 
+def _parse_date(value: str) -> date:
+    """Parse a str of the format "%Y-%m-%d" into a date.
+
+    The zero-padded form is parsed by date.fromisoformat, which is a lot
+    faster than strptime. Anything else, like "2020-4-7", is left to strptime.
+
+    Args:
+        value: the str to parse
+
+    Returns:
+        date: The parsed date.
+    """
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
 class PeriodOfTime:
     """A class representing a dcat:PeriodOfTime.
 
@@ -65,20 +85,17 @@ class PeriodOfTime:
             start date is after the end date
     """
 
-    __slots__ = ("_g", "_start_date", "_end_date", "_ref")
+    __slots__ = ("_g", "_rdf", "_start_date", "_end_date", "_ref")
 
-    _g: Graph
+    _g: Optional[Graph]
+    _rdf: Dict[Tuple[str, Optional[str]], Union[bytes, str]]
     _start_date: str
     _end_date: str
     _ref: Identifier
 
     def __init__(self) -> None:
         """Inits an object with default values."""
-        # set up graph and namespaces:
-        self._g = Graph()
-        self._g.bind("dct", DCT)
-        self._g.bind("dcat", DCAT)
-        self._g.bind("xsd", XSD)
+        self._clear_cache()
 
     @property
     def start_date(self: PeriodOfTime) -> str:
@@ -95,6 +112,7 @@ class PeriodOfTime:
                     start_date, self.end_date, "start_date after end_date"
                 )
         self._start_date = _date
+        self._clear_cache()
 
     @property
     def end_date(self: PeriodOfTime) -> str:
@@ -111,6 +129,7 @@ class PeriodOfTime:
                     end_date, self.start_date, "start_date after end_date"
                 )
         self._end_date = _date
+        self._clear_cache()
 
     # -
     def to_json(self) -> Dict:
@@ -157,24 +176,48 @@ class PeriodOfTime:
     def to_rdf(
         self: PeriodOfTime, format: str = "turtle", encoding: Optional[str] = "utf-8"
     ) -> Union[bytes, str]:
-        """Maps the period_of_time to rdf."""
-        return self._to_graph().serialize(format=format, encoding=encoding)
+        """Maps the period_of_time to rdf.
+
+        The graph and each serialization of it are kept until a date is changed.
+
+        Args:
+            format: a valid format. Default: turtle
+            encoding: the encoding to serialize into
+
+        Returns:
+            a rdf serialization as a bytes literal according to format.
+        """
+        key = (format, encoding)
+        if key not in self._rdf:
+            self._rdf[key] = self._to_graph().serialize(
+                format=format, encoding=encoding
+            )
+        return self._rdf[key]
 
     # -
     def _to_graph(self: PeriodOfTime) -> Graph:
+        if self._g is not None:
+            return self._g
+
+        # set up graph and namespaces:
+        graph = Graph()
+        graph.bind("dct", DCT)
+        graph.bind("dcat", DCAT)
+        graph.bind("xsd", XSD)
 
         self._ref = BNode()
-        self._g.add((self._ref, RDF.type, DCT.PeriodOfTime))
+        graph.add((self._ref, RDF.type, DCT.PeriodOfTime))
 
-        self._start_date_to_graph()
-        self._end_date_to_graph()
+        self._start_date_to_graph(graph)
+        self._end_date_to_graph(graph)
 
-        return self._g
+        self._g = graph
+        return graph
 
     # -
-    def _start_date_to_graph(self: PeriodOfTime) -> None:
+    def _start_date_to_graph(self: PeriodOfTime, graph: Graph) -> None:
         if getattr(self, "start_date", None):
-            self._g.add(
+            graph.add(
                 (
                     self._ref,
                     DCAT.startDate,
@@ -182,9 +225,9 @@ class PeriodOfTime:
                 )
             )
 
-    def _end_date_to_graph(self: PeriodOfTime) -> None:
+    def _end_date_to_graph(self: PeriodOfTime, graph: Graph) -> None:
         if getattr(self, "end_date", None):
-            self._g.add(
+            graph.add(
                 (
                     self._ref,
                     DCAT.endDate,
@@ -193,9 +236,11 @@ class PeriodOfTime:
             )
 
     # - helpers
+    def _clear_cache(self: PeriodOfTime) -> None:
+        self._g = None
+        self._rdf = {}
+
     def _is_valid_interval(self: PeriodOfTime, start_date: str, end_date: str) -> bool:
-        if datetime.strptime(start_date, "%Y-%m-%d") > datetime.strptime(
-            end_date, "%Y-%m-%d"
-        ):
+        if _parse_date(start_date) > _parse_date(end_date):
             return False
         return True
@@ -0,0 +1,40 @@
+"""Shared fixtures for the test suite."""
+import logging
+from typing import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockFixture
+from rdflib import plugin
+from rdflib.parser import Parser
+from rdflib.serializer import Serializer
+from skolemizer.testutils import skolemization
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _rdflib_session() -> Iterator[None]:
+    """Silences rdflib logging and loads the plugins once for the session."""
+    logger = logging.getLogger("rdflib")
+    level = logger.level
+    logger.setLevel(logging.CRITICAL)
+    for name in ("turtle", "nt"):
+        plugin.get(name, Parser)
+        plugin.get(name, Serializer)
+    yield
+    logger.setLevel(level)
+
+
+@pytest.fixture
+def skolemized(mocker: MockFixture) -> MagicMock:
+    """Gives every blank node the same skolemization from skolemizer.testutils.
+
+    Args:
+        mocker (MockFixture): the mocker undoing the patch after the test
+
+    Returns:
+        MagicMock: the patched Skolemizer.add_skolemization
+    """
+    return mocker.patch(
+        "skolemizer.Skolemizer.add_skolemization",
+        return_value=skolemization,
+    )
@@ -1,8 +1,6 @@
 """Test cases for the agent module."""
-from pytest_mock import MockFixture
+import pytest
 from rdflib import Graph
-from rdflib.compare import graph_diff, isomorphic
-from skolemizer.testutils import skolemization
 
 from datacatalogtordf import Agent, Dataset
 from tests.testutils import assert_isomorphic
@@ -24,14 +22,11 @@ def test_to_graph_should_return_identifier_set_at_constructor() -> None:
     g1 = Graph().parse(data=agent.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
-def test_to_graph_should_return_skolemization(mocker: MockFixture) -> None:
+@pytest.mark.usefixtures("skolemized")
+def test_to_graph_should_return_skolemization() -> None:
     """It returns a agent graph as with skolemization node isomorphic to spec."""
     agent = Agent()
 
@@ -48,11 +43,6 @@ def test_to_graph_should_return_skolemization(mocker: MockFixture) -> None:
 
         """
 
-    mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
-        return_value=skolemization,
-    )
-
     g1 = Graph().parse(data=agent.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
@@ -79,11 +69,7 @@ def test_to_graph_should_return_name_as_graph() -> None:
     g1 = Graph().parse(data=agent.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_publisher_as_bnode() -> None:
@@ -110,12 +96,7 @@ def test_to_graph_should_return_publisher_as_bnode() -> None:
     g1 = Graph().parse(data=dataset.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _dump_turtle(g1)
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_organizationid_as_graph() -> None:
@@ -138,11 +119,7 @@ def test_to_graph_should_return_organizationid_as_graph() -> None:
     g1 = Graph().parse(data=agent.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_organization_type_as_graph() -> None:
@@ -165,11 +142,7 @@ def test_to_graph_should_return_organization_type_as_graph() -> None:
     g1 = Graph().parse(data=agent.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_same_as() -> None:
@@ -193,11 +166,7 @@ def test_to_graph_should_return_same_as() -> None:
     g1 = Graph().parse(data=agent.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_json_should_return_partial_agent_as_json_dict() -> None:
@@ -250,28 +219,4 @@ def test_from_json_should_return_agent() -> None:
     g1 = Graph().parse(data=agent.to_rdf(), format="turtle")
     g2 = Graph().parse(data=agent_from_json.to_rdf(), format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
-
-
-# ---------------------------------------------------------------------- #
-# Utils for displaying debug information
-
-
-def _dump_diff(g1: Graph, g2: Graph) -> None:
-    in_both, in_first, in_second = graph_diff(g1, g2)
-    print("\nin both:")
-    _dump_turtle(in_both)
-    print("\nin first:")
-    _dump_turtle(in_first)
-    print("\nin second:")
-    _dump_turtle(in_second)
-
-
-def _dump_turtle(g: Graph) -> None:
-    for _l in g.serialize(format="turtle").splitlines():
-        if _l:
-            print(_l)
+    assert_isomorphic(g1, g2)
@@ -1,11 +1,10 @@
 """Test cases for the catalog module."""
-
 from typing import Any
 
+import pytest
 from pytest_mock import MockFixture
 from rdflib import Graph, Literal, Namespace, RDF, URIRef
-from rdflib.compare import graph_diff, isomorphic
-from skolemizer.testutils import skolemization, SkolemUtils
+from skolemizer.testutils import SkolemUtils
 
 from datacatalogtordf import Agent, Catalog, CatalogRecord, DataService, Dataset
 from tests.testutils import assert_isomorphic
@@ -31,11 +30,7 @@ def test_to_graph_should_return_identifier_set_at_constructor() -> None:
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_homepage() -> None:
@@ -58,11 +53,7 @@ def test_to_graph_should_return_homepage() -> None:
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_themes() -> None:
@@ -84,11 +75,7 @@ def test_to_graph_should_return_themes() -> None:
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_has_part() -> None:
@@ -112,11 +99,7 @@ def test_to_graph_should_return_has_part() -> None:
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_dataset_as_graph() -> None:
@@ -155,11 +138,7 @@ def test_to_graph_should_return_dataset_as_graph() -> None:
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_catalog_without_datasets_as_graph() -> None:
@@ -191,11 +170,7 @@ def test_to_graph_should_return_catalog_without_datasets_as_graph() -> None:
     g1 = Graph().parse(data=catalog.to_rdf(include_datasets=False), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_service() -> None:
@@ -234,11 +209,7 @@ def test_to_graph_should_return_service() -> None:
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_catalog_without_services_as_graph() -> None:
@@ -270,11 +241,7 @@ def test_to_graph_should_return_catalog_without_services_as_graph() -> None:
     g1 = Graph().parse(data=catalog.to_rdf(include_services=False), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_catalog() -> None:
@@ -298,11 +265,7 @@ def test_to_graph_should_return_catalog() -> None:
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_catalog_record() -> None:
@@ -326,11 +289,7 @@ def test_to_graph_should_return_catalog_record() -> None:
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_catalog_without_removed_service_as_graph() -> None:
@@ -367,12 +326,7 @@ def test_to_graph_should_return_catalog_without_removed_service_as_graph() -> No
     g1 = Graph().parse(data=catalog.to_rdf(include_services=False), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _dump_turtle(g1)
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def model_to_graph(model: Any) -> Graph:
@@ -412,14 +366,11 @@ def test_to_graph_should_return_dct_identifier_as_graph() -> None:
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
-def test_to_graph_should_return_blank_skolemization(mocker: MockFixture) -> None:
+@pytest.mark.usefixtures("skolemized")
+def test_to_graph_should_return_blank_skolemization() -> None:
     """It returns a catalog graph as blank node isomorphic to spec."""
     catalog = Catalog()
 
@@ -434,18 +385,14 @@ def test_to_graph_should_return_blank_skolemization(mocker: MockFixture) -> None
 
         """
 
-    mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
-        return_value=skolemization,
-    )
-
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
     assert_isomorphic(g1, g2)
 
 
-def test_to_graph_should_return_has_part_skolemization(mocker: MockFixture) -> None:
+@pytest.mark.usefixtures("skolemized")
+def test_to_graph_should_return_has_part_skolemization() -> None:
     """It returns a has has_part graph isomorphic to spec."""
     catalog = Catalog()
     catalog.identifier = "http://example.com/catalogs/1"
@@ -465,19 +412,10 @@ def test_to_graph_should_return_has_part_skolemization(mocker: MockFixture) -> N
 
     """
 
-    mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
-        return_value=skolemization,
-    )
-
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_dataset_skolemization(mocker: MockFixture) -> None:
@@ -525,11 +463,7 @@ def test_to_graph_should_return_dataset_skolemization(mocker: MockFixture) -> No
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_dataservice_skolemization(mocker: MockFixture) -> None:
@@ -577,14 +511,11 @@ def test_to_graph_should_return_dataservice_skolemization(mocker: MockFixture) -
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
-def test_to_graph_should_return_catalog_skolemization(mocker: MockFixture) -> None:
+@pytest.mark.usefixtures("skolemized")
+def test_to_graph_should_return_catalog_skolemization() -> None:
     """It returns a has catalog graph isomorphic to spec."""
     catalog = Catalog()
     catalog.identifier = "http://example.com/catalogs/1"
@@ -604,24 +535,14 @@ def test_to_graph_should_return_catalog_skolemization(mocker: MockFixture) -> No
 
     """
 
-    mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
-        return_value=skolemization,
-    )
-
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
-def test_to_graph_should_return_catalog_record_skolemization(
-    mocker: MockFixture,
-) -> None:
+@pytest.mark.usefixtures("skolemized")
+def test_to_graph_should_return_catalog_record_skolemization() -> None:
     """It returns a catalog record graph isomorphic to spec."""
     catalog = Catalog()
     catalog.identifier = "http://example.com/catalogs/1"
@@ -641,19 +562,10 @@ def test_to_graph_should_return_catalog_record_skolemization(
     .
     """
 
-    mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
-        return_value=skolemization,
-    )
-
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_json_should_return_partial_catalog_as_json_dict() -> None:
@@ -886,28 +798,4 @@ def test_from_json_should_return_catalog() -> None:
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=catalog_from_json.to_rdf(), format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
-
-
-# ---------------------------------------------------------------------- #
-# Utils for displaying debug information
-
-
-def _dump_diff(g1: Graph, g2: Graph) -> None:
-    in_both, in_first, in_second = graph_diff(g1, g2)
-    print("\nin both:")
-    _dump_turtle(in_both)
-    print("\nin first:")
-    _dump_turtle(in_first)
-    print("\nin second:")
-    _dump_turtle(in_second)
-
-
-def _dump_turtle(g: Graph) -> None:
-    for _l in g.serialize(format="turtle").splitlines():
-        if _l:
-            print(_l)
+    assert_isomorphic(g1, g2)
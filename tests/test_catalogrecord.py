@@ -1,9 +1,6 @@
 """Test cases for the dataset module."""
 import pytest
-from pytest_mock import MockFixture
 from rdflib import Graph
-from rdflib.compare import graph_diff, isomorphic
-from skolemizer.testutils import skolemization
 
 from datacatalogtordf import CatalogRecord, Dataset, InvalidURIError
 from tests.testutils import assert_isomorphic
@@ -24,11 +21,7 @@ def test_to_graph_should_return_identifier_set_at_constructor() -> None:
     g1 = Graph().parse(data=catalogrecord.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_identifier() -> None:
@@ -47,14 +40,11 @@ def test_to_graph_should_return_identifier() -> None:
     g1 = Graph().parse(data=catalogrecord.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
-def test_to_graph_should_return_skolemization(mocker: MockFixture) -> None:
+@pytest.mark.usefixtures("skolemized")
+def test_to_graph_should_return_skolemization() -> None:
     """It returns a skolemized identifier graph isomorphic to spec."""
     catalogrecord = CatalogRecord()
 
@@ -71,11 +61,6 @@ def test_to_graph_should_return_skolemization(mocker: MockFixture) -> None:
 
         """
 
-    mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
-        return_value=skolemization,
-    )
-
     g1 = Graph().parse(data=catalogrecord.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
@@ -102,11 +87,7 @@ def test_to_graph_should_return_title() -> None:
     g1 = Graph().parse(data=catalogrecord.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_description() -> None:
@@ -128,11 +109,7 @@ def test_to_graph_should_return_description() -> None:
     g1 = Graph().parse(data=catalogrecord.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_listing_date() -> None:
@@ -155,11 +132,7 @@ def test_to_graph_should_return_listing_date() -> None:
     g1 = Graph().parse(data=catalogrecord.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_modification_date() -> None:
@@ -182,11 +155,7 @@ def test_to_graph_should_return_modification_date() -> None:
     g1 = Graph().parse(data=catalogrecord.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_primary_topic() -> None:
@@ -212,16 +181,11 @@ def test_to_graph_should_return_primary_topic() -> None:
     g1 = Graph().parse(data=catalogrecord.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
-def test_to_graph_should_return_primary_topic_skolemization(
-    mocker: MockFixture,
-) -> None:
+@pytest.mark.usefixtures("skolemized")
+def test_to_graph_should_return_primary_topic_skolemization() -> None:
     """It returns a primary_topic graph isomorphic to spec."""
     catalogrecord = CatalogRecord()
     catalogrecord.identifier = "http://example.com/catalogrecords/1"
@@ -242,19 +206,10 @@ def test_to_graph_should_return_primary_topic_skolemization(
     .
     """
 
-    mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
-        return_value=skolemization,
-    )
-
     g1 = Graph().parse(data=catalogrecord.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_conforms_to() -> None:
@@ -278,11 +233,7 @@ def test_to_graph_should_return_conforms_to() -> None:
     g1 = Graph().parse(data=catalogrecord.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_set_conforms_to_list_of_invalid_formats() -> None:
@@ -342,28 +293,4 @@ def test_from_json_should_return_catalog_record() -> None:
     g1 = Graph().parse(data=record.to_rdf(), format="turtle")
     g2 = Graph().parse(data=catalog_record_from_json.to_rdf(), format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
-
-
-# ---------------------------------------------------------------------- #
-# Utils for displaying debug information
-
-
-def _dump_diff(g1: Graph, g2: Graph) -> None:
-    in_both, in_first, in_second = graph_diff(g1, g2)
-    print("\nin both:")
-    _dump_turtle(in_both)
-    print("\nin first:")
-    _dump_turtle(in_first)
-    print("\nin second:")
-    _dump_turtle(in_second)
-
-
-def _dump_turtle(g: Graph) -> None:
-    for _l in g.serialize(format="turtle").splitlines():
-        if _l:
-            print(_l)
+    assert_isomorphic(g1, g2)
@@ -1,8 +1,6 @@
 """Test cases for the contact module."""
-from pytest_mock import MockFixture
+import pytest
 from rdflib import Graph
-from rdflib.compare import graph_diff, isomorphic
-from skolemizer.testutils import skolemization
 
 from datacatalogtordf import Contact
 from tests.testutils import assert_isomorphic
@@ -24,14 +22,11 @@ def test_to_graph_should_return_identifier_set_at_constructor() -> None:
     g1 = Graph().parse(data=contact.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
-def test_to_graph_should_return_skolemization(mocker: MockFixture) -> None:
+@pytest.mark.usefixtures("skolemized")
+def test_to_graph_should_return_skolemization() -> None:
     """It returns a contact graph as with skolemization node isomorphic to spec."""
     contact = Contact()
 
@@ -47,11 +42,6 @@ def test_to_graph_should_return_skolemization(mocker: MockFixture) -> None:
 
         """
 
-    mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
-        return_value=skolemization,
-    )
-
     g1 = Graph().parse(data=contact.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
@@ -77,11 +67,7 @@ def test_to_graph_should_return_name_as_graph() -> None:
     g1 = Graph().parse(data=contact.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_email_as_graph() -> None:
@@ -104,11 +90,7 @@ def test_to_graph_should_return_email_as_graph() -> None:
     g1 = Graph().parse(data=contact.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_telephone_as_graph() -> None:
@@ -131,11 +113,7 @@ def test_to_graph_should_return_telephone_as_graph() -> None:
     g1 = Graph().parse(data=contact.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_url_as_graph() -> None:
@@ -158,11 +136,7 @@ def test_to_graph_should_return_url_as_graph() -> None:
     g1 = Graph().parse(data=contact.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_json_should_return_contact_as_json_dict() -> None:
@@ -196,28 +170,4 @@ def test_from_json_should_return_contact() -> None:
     g1 = Graph().parse(data=contact.to_rdf(), format="turtle")
     g2 = Graph().parse(data=contact_from_json.to_rdf(), format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
-
-
-# ---------------------------------------------------------------------- #
-# Utils for displaying debug information
-
-
-def _dump_diff(g1: Graph, g2: Graph) -> None:
-    in_both, in_first, in_second = graph_diff(g1, g2)
-    print("\nin both:")
-    _dump_turtle(in_both)
-    print("\nin first:")
-    _dump_turtle(in_first)
-    print("\nin second:")
-    _dump_turtle(in_second)
-
-
-def _dump_turtle(g: Graph) -> None:
-    for _l in g.serialize(format="turtle").splitlines():
-        if _l:
-            print(_l)
+    assert_isomorphic(g1, g2)
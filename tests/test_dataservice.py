@@ -1,10 +1,9 @@
 """Test cases for the dataservice module."""
-from pytest_mock import MockFixture
+import pytest
 from rdflib import Graph
-from rdflib.compare import graph_diff, isomorphic
-from skolemizer.testutils import skolemization
 
 from datacatalogtordf import DataService, Dataset
+from tests.testutils import assert_isomorphic
 
 
 def test_to_graph_should_return_identifier_set_at_constructor() -> None:
@@ -23,14 +22,11 @@ def test_to_graph_should_return_identifier_set_at_constructor() -> None:
     g1 = Graph().parse(data=dataService.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
-def test_to_graph_should_return_skolemization(mocker: MockFixture) -> None:
+@pytest.mark.usefixtures("skolemized")
+def test_to_graph_should_return_skolemization() -> None:
     """It returns a endpointURL graph isomorphic to spec."""
     dataService = DataService()
 
@@ -45,19 +41,10 @@ def test_to_graph_should_return_skolemization(mocker: MockFixture) -> None:
         .
     """
 
-    mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
-        return_value=skolemization,
-    )
-
     g1 = Graph().parse(data=dataService.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_endpointURL_as_graph() -> None:
@@ -79,11 +66,7 @@ def test_to_graph_should_return_endpointURL_as_graph() -> None:
     g1 = Graph().parse(data=dataService.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_endpointDescription_as_graph() -> None:
@@ -104,11 +87,7 @@ def test_to_graph_should_return_endpointDescription_as_graph() -> None:
     g1 = Graph().parse(data=dataService.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_servesDataset_as_graph() -> None:
@@ -138,16 +117,11 @@ def test_to_graph_should_return_servesDataset_as_graph() -> None:
     g1 = Graph().parse(data=dataService.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
-def test_to_graph_should_return_servesDataset_skolemization(
-    mocker: MockFixture,
-) -> None:
+@pytest.mark.usefixtures("skolemized")
+def test_to_graph_should_return_servesDataset_skolemization() -> None:
     """It returns a servesDataset graph isomorphic to spec."""
     dataService = DataService()
     dataService.identifier = "http://example.com/dataservices/1"
@@ -167,19 +141,10 @@ def test_to_graph_should_return_servesDataset_skolemization(
     .
     """
 
-    mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
-        return_value=skolemization,
-    )
-
     g1 = Graph().parse(data=dataService.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_media_type() -> None:
@@ -204,11 +169,7 @@ def test_to_graph_should_return_media_type() -> None:
     g1 = Graph().parse(data=dataService.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_json_should_return_data_service_as_json_dict() -> None:
@@ -267,28 +228,4 @@ def test_from_json_should_return_data_service() -> None:
     g1 = Graph().parse(data=data_service.to_rdf(), format="turtle")
     g2 = Graph().parse(data=data_service_from_json.to_rdf(), format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
-
-
-# ---------------------------------------------------------------------- #
-# Utils for displaying debug information
-
-
-def _dump_diff(g1: Graph, g2: Graph) -> None:
-    in_both, in_first, in_second = graph_diff(g1, g2)
-    print("\nin both:")
-    _dump_turtle(in_both)
-    print("\nin first:")
-    _dump_turtle(in_first)
-    print("\nin second:")
-    _dump_turtle(in_second)
-
-
-def _dump_turtle(g: Graph) -> None:
-    for _l in g.serialize(format="turtle").splitlines():
-        if _l:
-            print(_l)
+    assert_isomorphic(g1, g2)
@@ -2,10 +2,7 @@
 from decimal import Decimal
 
 import pytest
-from pytest_mock import MockFixture
 from rdflib import Graph
-from rdflib.compare import graph_diff, isomorphic
-from skolemizer.testutils import skolemization
 
 from datacatalogtordf import (
     Agent,
@@ -18,6 +15,7 @@ from datacatalogtordf import (
     PeriodOfTime,
     Relationship,
 )
+from tests.testutils import assert_isomorphic
 
 
 def test_to_graph_should_return_identifier_set_at_constructor() -> None:
@@ -36,14 +34,11 @@ def test_to_graph_should_return_identifier_set_at_constructor() -> None:
     g1 = Graph().parse(data=dataset.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
-def test_to_graph_should_return_skolemization(mocker: MockFixture) -> None:
+@pytest.mark.usefixtures("skolemized")
+def test_to_graph_should_return_skolemization() -> None:
     """It returns a endpointURL graph isomorphic to spec."""
     dataset = Dataset()
 
@@ -58,19 +53,10 @@ def test_to_graph_should_return_skolemization(mocker: MockFixture) -> None:
         .
     """
 
-    mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
-        return_value=skolemization,
-    )
-
     g1 = Graph().parse(data=dataset.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_distribution_as_graph() -> None:
@@ -104,14 +90,11 @@ def test_to_graph_should_return_distribution_as_graph() -> None:
     )
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
-def test_to_graph_should_return_distribution_skolemized(mocker: MockFixture) -> None:
+@pytest.mark.usefixtures("skolemized")
+def test_to_graph_should_return_distribution_skolemized() -> None:
     """It returns a distribution graph isomorphic to spec."""
     dataset = Dataset()
     dataset.identifier = "http://example.com/datasets/1"
@@ -132,21 +115,12 @@ def test_to_graph_should_return_distribution_skolemized(mocker: MockFixture) ->
         .
     """
 
-    mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
-        return_value=skolemization,
-    )
-
     g1 = Graph().parse(
         data=dataset.to_rdf(include_distributions=False), format="turtle"
     )
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_included_distribution_as_graph() -> None:
@@ -188,11 +162,7 @@ def test_to_graph_should_return_included_distribution_as_graph() -> None:
     g1 = Graph().parse(data=dataset.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_frequency() -> None:
@@ -214,11 +184,7 @@ def test_to_graph_should_return_frequency() -> None:
     g1 = Graph().parse(data=dataset.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_spatial() -> None:
@@ -248,11 +214,7 @@ def test_to_graph_should_return_spatial() -> None:
     g1 = Graph().parse(data=dataset.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_spatial_resolution_in_meters() -> None:
@@ -276,11 +238,7 @@ def test_to_graph_should_return_spatial_resolution_in_meters() -> None:
     g1 = Graph().parse(data=dataset.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_temporal() -> None:
@@ -311,11 +269,7 @@ def test_to_graph_should_return_temporal() -> None:
     g1 = Graph().parse(data=dataset.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_temporal_resolution() -> None:
@@ -338,11 +292,7 @@ def test_to_graph_should_return_temporal_resolution() -> None:
     g1 = Graph().parse(data=dataset.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_was_generated_by() -> None:
@@ -366,11 +316,7 @@ def test_to_graph_should_return_was_generated_by() -> None:
     g1 = Graph().parse(data=dataset.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_access_rights_comment() -> None:
@@ -394,11 +340,7 @@ def test_to_graph_should_return_access_rights_comment() -> None:
     g1 = Graph().parse(data=dataset.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_set_access_rights_with_list_of_invalid_uris() -> None:
@@ -432,11 +374,7 @@ def test_to_graph_should_return_link_to_spatial() -> None:
     g1 = Graph().parse(data=dataset.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_link_to_spatial_with_location_triple() -> None:
@@ -468,11 +406,7 @@ def test_to_graph_should_return_link_to_spatial_with_location_triple() -> None:
     g1 = Graph().parse(data=dataset.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_dct_identifier_as_graph() -> None:
@@ -494,11 +428,7 @@ def test_to_graph_should_return_dct_identifier_as_graph() -> None:
     g1 = Graph().parse(data=dataset.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_json_should_return_dataset_as_json_dict() -> None:
@@ -598,28 +528,4 @@ def test_from_json_should_return_dataset() -> None:
     g1 = Graph().parse(data=dataset.to_rdf(), format="turtle")
     g2 = Graph().parse(data=dataset_from_json.to_rdf(), format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
-
-
-# ---------------------------------------------------------------------- #
-# Utils for displaying debug information
-
-
-def _dump_diff(g1: Graph, g2: Graph) -> None:
-    in_both, in_first, in_second = graph_diff(g1, g2)
-    print("\nin both:")
-    _dump_turtle(in_both)
-    print("\nin first:")
-    _dump_turtle(in_first)
-    print("\nin second:")
-    _dump_turtle(in_second)
-
-
-def _dump_turtle(g: Graph) -> None:
-    for _l in g.serialize(format="turtle").splitlines():
-        if _l:
-            print(_l)
+    assert_isomorphic(g1, g2)
@@ -1,8 +1,8 @@
 """Test cases for the dataset_series module."""
 from rdflib import Graph
-from rdflib.compare import graph_diff, isomorphic
 
 from datacatalogtordf import Catalog, Dataset, DatasetSeries
+from tests.testutils import assert_isomorphic
 
 
 def test_catalog_to_graph_should_return_dataset_series() -> None:
@@ -78,11 +78,7 @@ def test_catalog_to_graph_should_return_dataset_series() -> None:
     g1 = Graph().parse(data=catalog.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_dataset_series() -> None:
@@ -149,11 +145,7 @@ def test_to_graph_should_return_dataset_series() -> None:
     g1 = Graph().parse(data=dataset_series.to_rdf(), format="turtle")
     g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_json_should_return_dataset_series_as_json_dict() -> None:
@@ -290,28 +282,4 @@ def test_from_json_should_return_dataset_series() -> None:
     g1 = Graph().parse(data=dataset_series.to_rdf(), format="turtle")
     g2 = Graph().parse(data=dataset_series_from_json.to_rdf(), format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
-
-
-# ---------------------------------------------------------------------- #
-# Utils for displaying debug information
-
-
-def _dump_diff(g1: Graph, g2: Graph) -> None:
-    in_both, in_first, in_second = graph_diff(g1, g2)
-    print("\nin both:")
-    _dump_turtle(in_both)
-    print("\nin first:")
-    _dump_turtle(in_first)
-    print("\nin second:")
-    _dump_turtle(in_second)
-
-
-def _dump_turtle(g: Graph) -> None:
-    for _l in g.serialize(format="turtle").splitlines():
-        if _l:
-            print(_l)
+    assert_isomorphic(g1, g2)
@@ -1,10 +1,10 @@
 """Test cases for the location module."""
-from pytest_mock import MockFixture
-from rdflib import Graph
-from rdflib.compare import graph_diff, isomorphic
-from skolemizer.testutils import skolemization  # type: ignore
+from typing import Dict, Tuple
+
+import pytest
 
 from datacatalogtordf import Location
+from tests.testutils import assert_isomorphic, assert_same_triples, parse_graph
 
 
 def test_to_graph_should_return_identifier_set_at_constructor() -> None:
@@ -13,77 +13,30 @@ def test_to_graph_should_return_identifier_set_at_constructor() -> None:
     location.centroid = "POINT(4.88412 52.37509)"
 
     src = """
-    @prefix dct: <http://purl.org/dc/terms/> .
-    @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
-    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-    @prefix dcat: <http://www.w3.org/ns/dcat#> .
-    @prefix locn: <http://www.w3.org/ns/locn#> .
-    @prefix geosparql: <http://www.opengis.net/ont/geosparql#> .
-
-    <http://example.com/locations/1> a dct:Location ;
-        dcat:centroid "POINT(4.88412 52.37509)"^^geosparql:asWKT ;
-    .
+    <http://example.com/locations/1> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://purl.org/dc/terms/Location> .
+    <http://example.com/locations/1> <http://www.w3.org/ns/dcat#centroid> "POINT(4.88412 52.37509)"^^<http://www.opengis.net/ont/geosparql#asWKT> .
     """
-    g1 = Graph().parse(data=location.to_rdf(), format="turtle")
-    g2 = Graph().parse(data=src, format="turtle")
+    g1 = location._to_graph()
+    g2 = parse_graph(src, format="nt")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_same_triples(g1, g2)
 
 
-def test_to_graph_should_return_location_skolemized(mocker: MockFixture) -> None:
+@pytest.mark.usefixtures("skolemized")
+def test_to_graph_should_return_location_skolemized() -> None:
     """It returns a title graph isomorphic to spec."""
     location = Location()
-    location.geometry = """POLYGON ((
-          4.8842353 52.375108 , 4.884276 52.375153 ,
-          4.8842567 52.375159 , 4.883981 52.375254 ,
-          4.8838502 52.375109 , 4.883819 52.375075 ,
-          4.8841037 52.374979 , 4.884143 52.374965 ,
-          4.8842069 52.375035 , 4.884263 52.375016 ,
-          4.8843200 52.374996 , 4.884255 52.374926 ,
-          4.8843289 52.374901 , 4.884451 52.375034 ,
-          4.8842353 52.375108
-          ))"""
+    location.geometry = "POLYGON ((0 0, 1 0, 1 1, 0 1, 0 0))"
 
     src = """
-    @prefix dct: <http://purl.org/dc/terms/> .
-    @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
-    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-    @prefix dcat: <http://www.w3.org/ns/dcat#> .
-    @prefix locn: <http://www.w3.org/ns/locn#> .
-    @prefix geosparql: <http://www.opengis.net/ont/geosparql#> .
-
-    <http://wwww.digdir.no/.well-known/skolem/284db4d2-80c2-11eb-82c3-83e80baa2f94>
-        a dct:Location ;
-        locn:geometry \"\"\"POLYGON ((
-          4.8842353 52.375108 , 4.884276 52.375153 ,
-          4.8842567 52.375159 , 4.883981 52.375254 ,
-          4.8838502 52.375109 , 4.883819 52.375075 ,
-          4.8841037 52.374979 , 4.884143 52.374965 ,
-          4.8842069 52.375035 , 4.884263 52.375016 ,
-          4.8843200 52.374996 , 4.884255 52.374926 ,
-          4.8843289 52.374901 , 4.884451 52.375034 ,
-          4.8842353 52.375108
-          ))\"\"\"^^geosparql:asWKT ;
-    .
+    <http://wwww.digdir.no/.well-known/skolem/284db4d2-80c2-11eb-82c3-83e80baa2f94> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://purl.org/dc/terms/Location> .
+    <http://wwww.digdir.no/.well-known/skolem/284db4d2-80c2-11eb-82c3-83e80baa2f94> <http://www.w3.org/ns/locn#geometry> "POLYGON ((0 0, 1 0, 1 1, 0 1, 0 0))"^^<http://www.opengis.net/ont/geosparql#asWKT> .
     """
 
-    mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
-        return_value=skolemization,
-    )
-
-    g1 = Graph().parse(data=location.to_rdf(), format="turtle")
-    g2 = Graph().parse(data=src, format="turtle")
+    g1 = location._to_graph()
+    g2 = parse_graph(src, format="nt")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_same_triples(g1, g2)
 
 
 def test_to_graph_should_return_geometry_as_graph() -> None:
@@ -102,34 +55,13 @@ def test_to_graph_should_return_geometry_as_graph() -> None:
           ))"""
 
     src = """
-    @prefix dct: <http://purl.org/dc/terms/> .
-    @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
-    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-    @prefix dcat: <http://www.w3.org/ns/dcat#> .
-    @prefix locn: <http://www.w3.org/ns/locn#> .
-    @prefix geosparql: <http://www.opengis.net/ont/geosparql#> .
-
-    <http://example.com/locations/1>    a dct:Location ;
-        locn:geometry \"\"\"POLYGON ((
-          4.8842353 52.375108 , 4.884276 52.375153 ,
-          4.8842567 52.375159 , 4.883981 52.375254 ,
-          4.8838502 52.375109 , 4.883819 52.375075 ,
-          4.8841037 52.374979 , 4.884143 52.374965 ,
-          4.8842069 52.375035 , 4.884263 52.375016 ,
-          4.8843200 52.374996 , 4.884255 52.374926 ,
-          4.8843289 52.374901 , 4.884451 52.375034 ,
-          4.8842353 52.375108
-          ))\"\"\"^^geosparql:asWKT ;
-    .
+    <http://example.com/locations/1> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://purl.org/dc/terms/Location> .
+    <http://example.com/locations/1> <http://www.w3.org/ns/locn#geometry> "POLYGON ((\\n          4.8842353 52.375108 , 4.884276 52.375153 ,\\n          4.8842567 52.375159 , 4.883981 52.375254 ,\\n          4.8838502 52.375109 , 4.883819 52.375075 ,\\n          4.8841037 52.374979 , 4.884143 52.374965 ,\\n          4.8842069 52.375035 , 4.884263 52.375016 ,\\n          4.8843200 52.374996 , 4.884255 52.374926 ,\\n          4.8843289 52.374901 , 4.884451 52.375034 ,\\n          4.8842353 52.375108\\n          ))"^^<http://www.opengis.net/ont/geosparql#asWKT> .
     """
-    g1 = Graph().parse(data=location.to_rdf(), format="turtle")
-    g2 = Graph().parse(data=src, format="turtle")
+    g1 = location._to_graph()
+    g2 = parse_graph(src, format="nt")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_same_triples(g1, g2)
 
 
 def test_to_graph_should_return_bounding_box_as_graph() -> None:
@@ -143,29 +75,13 @@ def test_to_graph_should_return_bounding_box_as_graph() -> None:
                 ))"""
 
     src = """
-    @prefix dct: <http://purl.org/dc/terms/> .
-    @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
-    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-    @prefix dcat: <http://www.w3.org/ns/dcat#> .
-    @prefix locn: <http://www.w3.org/ns/locn#> .
-    @prefix geosparql: <http://www.opengis.net/ont/geosparql#> .
-
-    <http://example.com/locations/1> a dct:Location ;
-        dcat:bbox \"\"\"POLYGON ((
-                3.053 47.975 , 7.24  47.975 ,
-                7.24  53.504 , 3.053 53.504 ,
-                3.053 47.975
-                ))\"\"\"^^geosparql:asWKT ;
-    .
+    <http://example.com/locations/1> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://purl.org/dc/terms/Location> .
+    <http://example.com/locations/1> <http://www.w3.org/ns/dcat#bbox> "POLYGON ((\\n                3.053 47.975 , 7.24  47.975 ,\\n                7.24  53.504 , 3.053 53.504 ,\\n                3.053 47.975\\n                ))"^^<http://www.opengis.net/ont/geosparql#asWKT> .
     """
-    g1 = Graph().parse(data=location.to_rdf(), format="turtle")
-    g2 = Graph().parse(data=src, format="turtle")
+    g1 = location._to_graph()
+    g2 = parse_graph(src, format="nt")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_same_triples(g1, g2)
 
 
 def test_to_graph_should_return_centroid_as_graph() -> None:
@@ -175,35 +91,31 @@ def test_to_graph_should_return_centroid_as_graph() -> None:
     location.centroid = "POINT(4.88412 52.37509)"
 
     src = """
-    @prefix dct: <http://purl.org/dc/terms/> .
-    @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
-    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-    @prefix dcat: <http://www.w3.org/ns/dcat#> .
-    @prefix locn: <http://www.w3.org/ns/locn#> .
-    @prefix geosparql: <http://www.opengis.net/ont/geosparql#> .
-
-    <http://example.com/locations/1> a dct:Location ;
-        dcat:centroid \"POINT(4.88412 52.37509)\"^^geosparql:asWKT ;
-    .
+    <http://example.com/locations/1> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://purl.org/dc/terms/Location> .
+    <http://example.com/locations/1> <http://www.w3.org/ns/dcat#centroid> "POINT(4.88412 52.37509)"^^<http://www.opengis.net/ont/geosparql#asWKT> .
     """
-    g1 = Graph().parse(data=location.to_rdf(), format="turtle")
-    g2 = Graph().parse(data=src, format="turtle")
+    g1 = location._to_graph()
+    g2 = parse_graph(src, format="nt")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_same_triples(g1, g2)
 
 
-def test_to_json_should_return_location_as_json_dict() -> None:
-    """It returns a catalog json dict."""
+@pytest.fixture(scope="module")
+def built_location() -> Tuple[Location, Dict]:
+    """Returns a location and its json, shared by the json tests."""
     loc = Location()
     loc.identifier = "http://loc-identifier"
     loc.geometry = "geometry"
     loc.bounding_box = "bouding box"
     loc.centroid = "centroid"
-    json = loc.to_json()
+    return loc, loc.to_json()
+
+
+def test_to_json_should_return_location_as_json_dict(
+    built_location: Tuple[Location, Dict]
+) -> None:
+    """It returns a catalog json dict."""
+    _, json = built_location
 
     assert json == {
         "_type": "Location",
@@ -214,42 +126,15 @@ def test_to_json_should_return_location_as_json_dict() -> None:
     }
 
 
-def test_from_json_should_return_location() -> None:
+def test_from_json_should_return_location(
+    built_location: Tuple[Location, Dict]
+) -> None:
     """It returns a catalog json dict."""
-    loc = Location()
-    loc.identifier = "http://loc-identifier"
-    loc.geometry = "geometry"
-    loc.bounding_box = "bouding box"
-    loc.centroid = "centroid"
-    json = loc.to_json()
+    loc, json = built_location
 
     loc_from_json = Location.from_json(json)
 
-    g1 = Graph().parse(data=loc.to_rdf(), format="turtle")
-    g2 = Graph().parse(data=loc_from_json.to_rdf(), format="turtle")
-
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
-
-
-# ---------------------------------------------------------------------- #
-# Utils for displaying debug information
-
-
-def _dump_diff(g1: Graph, g2: Graph) -> None:
-    in_both, in_first, in_second = graph_diff(g1, g2)
-    print("\nin both:")
-    _dump_turtle(in_both)
-    print("\nin first:")
-    _dump_turtle(in_first)
-    print("\nin second:")
-    _dump_turtle(in_second)
-
+    g1 = parse_graph(loc.to_rdf())
+    g2 = parse_graph(loc_from_json.to_rdf())
 
-def _dump_turtle(g: Graph) -> None:
-    for _l in g.serialize(format="turtle").splitlines():
-        if _l:
-            print(_l)
+    assert_isomorphic(g1, g2)
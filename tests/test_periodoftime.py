@@ -1,9 +1,23 @@
 """Test cases for the relationship module."""
 import pytest
-from rdflib import Graph
-from rdflib.compare import graph_diff, isomorphic
 
 from datacatalogtordf import InvalidDateError, InvalidDateIntervalError, PeriodOfTime
+from tests.testutils import assert_isomorphic, parse_graph
+
+
+# The triples the specs of a period of time are made of:
+PERIOD_OF_TIME_TYPE = (
+    "_:b0 <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> "
+    "<http://purl.org/dc/terms/PeriodOfTime> .\n"
+)
+START_DATE = (
+    "_:b0 <http://www.w3.org/ns/dcat#startDate> "
+    '"2019-12-31"^^<http://www.w3.org/2001/XMLSchema#date> .\n'
+)
+END_DATE = (
+    "_:b0 <http://www.w3.org/ns/dcat#endDate> "
+    '"2020-12-31"^^<http://www.w3.org/2001/XMLSchema#date> .\n'
+)
 
 
 def test_to_graph_should_return_start_date_as_graph() -> None:
@@ -11,25 +25,11 @@ def test_to_graph_should_return_start_date_as_graph() -> None:
     period_of_time = PeriodOfTime()
     period_of_time.start_date = "2019-12-31"
 
-    src = """
-    @prefix dct: <http://purl.org/dc/terms/> .
-    @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
-    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-    @prefix dcat: <http://www.w3.org/ns/dcat#> .
-    @prefix xsd:   <http://www.w3.org/2001/XMLSchema#> .
+    src = PERIOD_OF_TIME_TYPE + START_DATE
+    g1 = parse_graph(period_of_time.to_rdf())
+    g2 = parse_graph(src, format="nt")
 
-    [] a dct:PeriodOfTime ;
-        dcat:startDate "2019-12-31"^^xsd:date ;
-    .
-    """
-    g1 = Graph().parse(data=period_of_time.to_rdf(), format="turtle")
-    g2 = Graph().parse(data=src, format="turtle")
-
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_end_date_as_graph() -> None:
@@ -37,25 +37,39 @@ def test_to_graph_should_return_end_date_as_graph() -> None:
     period_of_time = PeriodOfTime()
     period_of_time.end_date = "2020-12-31"
 
-    src = """
-    @prefix dct: <http://purl.org/dc/terms/> .
-    @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
-    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-    @prefix dcat: <http://www.w3.org/ns/dcat#> .
-    @prefix xsd:   <http://www.w3.org/2001/XMLSchema#> .
+    src = PERIOD_OF_TIME_TYPE + END_DATE
+    g1 = parse_graph(period_of_time.to_rdf())
+    g2 = parse_graph(src, format="nt")
+
+    assert_isomorphic(g1, g2)
 
-    [] a dct:PeriodOfTime ;
-        dcat:endDate "2020-12-31"^^xsd:date ;
-    .
-    """
-    g1 = Graph().parse(data=period_of_time.to_rdf(), format="turtle")
-    g2 = Graph().parse(data=src, format="turtle")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+def test_to_rdf_repeatedly_should_return_one_period_of_time() -> None:
+    """It returns the same period of time on every call."""
+    period_of_time = PeriodOfTime()
+    period_of_time.start_date = "2019-12-31"
+
+    src = PERIOD_OF_TIME_TYPE + START_DATE
+    turtle = period_of_time.to_rdf()
+    g1 = parse_graph(period_of_time.to_rdf(format="nt"), format="nt")
+    g2 = parse_graph(src, format="nt")
+
+    assert period_of_time.to_rdf() == turtle
+    assert_isomorphic(g1, g2)
+
+
+def test_to_rdf_should_return_changed_dates() -> None:
+    """It returns the dates as they are when called."""
+    period_of_time = PeriodOfTime()
+    period_of_time.start_date = "2019-12-31"
+    _ = period_of_time.to_rdf()
+    period_of_time.end_date = "2020-12-31"
+
+    src = PERIOD_OF_TIME_TYPE + START_DATE + END_DATE
+    g1 = parse_graph(period_of_time.to_rdf())
+    g2 = parse_graph(src, format="nt")
+
+    assert_isomorphic(g1, g2)
 
 
 def test_invalid_start_date() -> None:
@@ -88,6 +102,15 @@ def test_invalid_interval_end_date() -> None:
         _period_of_time.start_date = "2020-04-07"
 
 
+def test_interval_of_dates_without_zero_padding() -> None:
+    """It does not raise an exception."""
+    _period_of_time = PeriodOfTime()
+    _period_of_time.start_date = "2020-4-6"
+    _period_of_time.end_date = "2020-04-07"
+
+    assert _period_of_time.start_date == "2020-4-6"
+
+
 def test_to_json_should_return_partial_periodoftime_as_json_dict() -> None:
     """It returns a period of time json dict."""
     _period_of_time = PeriodOfTime()
@@ -123,31 +146,7 @@ def test_from_json_should_return_period_of_time_instance() -> None:
 
     _period_of_time_from_json = PeriodOfTime.from_json(_json)
 
-    g1 = Graph().parse(data=_period_of_time.to_rdf(), format="turtle")
-    g2 = Graph().parse(data=_period_of_time_from_json.to_rdf(), format="turtle")
-
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
-
-
-# ---------------------------------------------------------------------- #
-# Utils for displaying debug information
-
-
-def _dump_diff(g1: Graph, g2: Graph) -> None:
-    in_both, in_first, in_second = graph_diff(g1, g2)
-    print("\nin both:")
-    _dump_turtle(in_both)
-    print("\nin first:")
-    _dump_turtle(in_first)
-    print("\nin second:")
-    _dump_turtle(in_second)
-
+    g1 = parse_graph(_period_of_time.to_rdf())
+    g2 = parse_graph(_period_of_time_from_json.to_rdf())
 
-def _dump_turtle(g: Graph) -> None:
-    for _l in g.serialize(format="turtle").splitlines():
-        if _l:
-            print(_l)
+    assert_isomorphic(g1, g2)
@@ -1,109 +1,72 @@
 """Test cases for the relationship module."""
-from pytest_mock import MockFixture
-from rdflib import Graph
-from rdflib.compare import graph_diff, isomorphic
-from skolemizer.testutils import skolemization
+import pytest
 
 from datacatalogtordf import Dataset
 from datacatalogtordf import Relationship
+from tests.testutils import assert_isomorphic, assert_same_triples, parse_graph
 
 
-# import pytest
+# The dataset and the role every relationship in the graph tests is given:
+DATASET_URI = "http://example.com/datasets/1"
+ORIGINAL_ROLE = "http://www.iana.org/assignments/relation/original"
+
+# The spec of <http://example.com/relationships/1>, shared by the tests that
+# give the relationship that identifier:
+RELATIONSHIP = """
+    <http://example.com/relationships/1> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/ns/dcat#Relationship> .
+    <http://example.com/relationships/1> <http://purl.org/dc/terms/relation> <http://example.com/datasets/1> .
+    <http://example.com/relationships/1> <http://www.w3.org/ns/dcat#hadRole> <http://www.iana.org/assignments/relation/original> .
+    """
 
 
 def test_to_graph_should_return_identifier_set_at_constructor() -> None:
     """It returns a title graph isomorphic to spec."""
     relationship = Relationship("http://example.com/relationships/1")
-    relationship.had_role = "http://www.iana.org/assignments/relation/original"
+    relationship.had_role = ORIGINAL_ROLE
     dataset = Dataset()
-    dataset.identifier = "http://example.com/datasets/1"
+    dataset.identifier = DATASET_URI
     relationship.relation = dataset
 
-    src = """
-    @prefix dct: <http://purl.org/dc/terms/> .
-    @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
-    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-    @prefix dcat: <http://www.w3.org/ns/dcat#> .
-
-    <http://example.com/relationships/1> a dcat:Relationship ;
-        dct:relation   <http://example.com/datasets/1> ;
-        dcat:hadRole <http://www.iana.org/assignments/relation/original>
-    .
-    """
-    g1 = Graph().parse(data=relationship.to_rdf(), format="turtle")
-    g2 = Graph().parse(data=src, format="turtle")
+    g1 = parse_graph(relationship.to_rdf())
+    g2 = parse_graph(RELATIONSHIP, format="nt")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
-def test_to_graph_should_return_skolemization(mocker: MockFixture) -> None:
+@pytest.mark.usefixtures("skolemized")
+def test_to_graph_should_return_skolemization() -> None:
     """It returns a title graph isomorphic to spec."""
     relationship = Relationship()
-    relationship.had_role = "http://www.iana.org/assignments/relation/original"
+    relationship.had_role = ORIGINAL_ROLE
     dataset = Dataset()
-    dataset.identifier = "http://example.com/datasets/1"
+    dataset.identifier = DATASET_URI
     relationship.relation = dataset
 
     src = """
-    @prefix dct: <http://purl.org/dc/terms/> .
-    @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
-    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-    @prefix dcat: <http://www.w3.org/ns/dcat#> .
-
-    <http://wwww.digdir.no/.well-known/skolem/284db4d2-80c2-11eb-82c3-83e80baa2f94>
-     a dcat:Relationship ;
-        dct:relation   <http://example.com/datasets/1> ;
-        dcat:hadRole <http://www.iana.org/assignments/relation/original>
-    .
+    <http://wwww.digdir.no/.well-known/skolem/284db4d2-80c2-11eb-82c3-83e80baa2f94> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/ns/dcat#Relationship> .
+    <http://wwww.digdir.no/.well-known/skolem/284db4d2-80c2-11eb-82c3-83e80baa2f94> <http://purl.org/dc/terms/relation> <http://example.com/datasets/1> .
+    <http://wwww.digdir.no/.well-known/skolem/284db4d2-80c2-11eb-82c3-83e80baa2f94> <http://www.w3.org/ns/dcat#hadRole> <http://www.iana.org/assignments/relation/original> .
     """
 
-    mocker.patch(
-        "skolemizer.Skolemizer.add_skolemization",
-        return_value=skolemization,
-    )
+    g1 = parse_graph(relationship.to_rdf())
+    g2 = parse_graph(src, format="nt")
 
-    g1 = Graph().parse(data=relationship.to_rdf(), format="turtle")
-    g2 = Graph().parse(data=src, format="turtle")
-
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_graph_should_return_relation_as_graph() -> None:
     """It returns a title graph isomorphic to spec."""
     relationship = Relationship()
     relationship.identifier = "http://example.com/relationships/1"
-    relationship.had_role = "http://www.iana.org/assignments/relation/original"
+    relationship.had_role = ORIGINAL_ROLE
     dataset = Dataset()
-    dataset.identifier = "http://example.com/datasets/1"
+    dataset.identifier = DATASET_URI
     relationship.relation = dataset
 
-    src = """
-    @prefix dct: <http://purl.org/dc/terms/> .
-    @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
-    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-    @prefix dcat: <http://www.w3.org/ns/dcat#> .
-
-    <http://example.com/relationships/1> a dcat:Relationship ;
-        dct:relation   <http://example.com/datasets/1> ;
-        dcat:hadRole <http://www.iana.org/assignments/relation/original>
-    .
-    """
-    g1 = Graph().parse(data=relationship.to_rdf(), format="turtle")
-    g2 = Graph().parse(data=src, format="turtle")
+    g1 = parse_graph(relationship.to_rdf())
+    g2 = parse_graph(RELATIONSHIP, format="nt")
 
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
+    assert_isomorphic(g1, g2)
 
 
 def test_to_json_should_return_relationship_as_json_dict() -> None:
@@ -151,31 +114,7 @@ def test_from_json_should_return_relationship() -> None:
 
     rel_from_json = Relationship.from_json(json)
 
-    g1 = Graph().parse(data=rel.to_rdf(), format="turtle")
-    g2 = Graph().parse(data=rel_from_json.to_rdf(), format="turtle")
-
-    _isomorphic = isomorphic(g1, g2)
-    if not _isomorphic:
-        _dump_diff(g1, g2)
-        pass
-    assert _isomorphic
-
-
-# ---------------------------------------------------------------------- #
-# Utils for displaying debug information
-
-
-def _dump_diff(g1: Graph, g2: Graph) -> None:
-    in_both, in_first, in_second = graph_diff(g1, g2)
-    print("\nin both:")
-    _dump_turtle(in_both)
-    print("\nin first:")
-    _dump_turtle(in_first)
-    print("\nin second:")
-    _dump_turtle(in_second)
-
+    g1 = parse_graph(rel.to_rdf())
+    g2 = parse_graph(rel_from_json.to_rdf())
 
-def _dump_turtle(g: Graph) -> None:
-    for _l in g.serialize(format="turtle").splitlines():
-        if _l:
-            print(_l)
+    assert_same_triples(g1, g2)
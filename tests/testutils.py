@@ -1,36 +1,124 @@
-"""Utils for displaying debug information."""
+"""Utils for parsing graphs and displaying debug information."""
+from functools import lru_cache
+import sys
+from typing import FrozenSet, Iterable, Optional, Tuple, Union
 
-from rdflib import Graph
+from rdflib import BNode, Graph
 from rdflib.compare import graph_diff, isomorphic
+from rdflib.plugins.stores.memory import SimpleMemory
+from rdflib.term import Node
+
+
+def parse_graph(data: Union[str, bytes], format: str = "turtle") -> Graph:
+    """Parses data into a new graph.
+
+        Sources in any other format than N-Triples are converted to
+        N-Triples once per distinct source, so that identical sources
+        are only run through the (slow) turtle parser once. The graph is
+        backed by a SimpleMemory store, which skips the triple indexes
+        the default store keeps up on every add.
+
+    Args:
+        data (Union[str, bytes]): the rdf to parse
+        format (str): the format of data
+
+    Returns:
+        Graph: a new graph with the triples in data
+    """
+    if format != "nt":
+        data = _to_ntriples(data, format)
+    return Graph(store=SimpleMemory()).parse(data=data, format="nt")
+
+
+@lru_cache(maxsize=256)
+def _to_ntriples(data: Union[str, bytes], format: str) -> str:
+    return Graph().parse(data=data, format=format).serialize(format="nt")
 
 
 def assert_isomorphic(g1: Graph, g2: Graph) -> None:
     """Compares two graphs an asserts that they are isomorphic.
 
-        If not isomorpic a graph diff will be dumped.
+        If not isomorpic a graph diff will be dumped. Graphs with at
+        most one blank node each can only be mapped onto each other in
+        one way, so they are compared as sets of triples with the blank
+        node given a fixed label. Only graphs with more blank nodes are
+        canonicalized by isomorphic.
 
     Args:
         g1 (Graph): a graph to compare
         g2 (Graph): the graph to compare with
 
     """
-    _isomorphic = isomorphic(g1, g2)
+    triples1, triples2 = _fixed_bnode_triples(g1), _fixed_bnode_triples(g2)
+    if triples1 is not None and triples2 is not None:
+        _isomorphic = triples1 == triples2
+    else:
+        _isomorphic = isomorphic(g1, g2)
     if not _isomorphic:
         _dump_diff(g1, g2)
     assert _isomorphic
 
 
+def assert_same_triples(g1: Graph, g2: Graph) -> None:
+    """Compares two graphs without blank nodes and asserts they are equal.
+
+        Without blank nodes isomorphism reduces to equal sets of triples,
+        which is a lot cheaper to check than isomorphic. If not equal a
+        graph diff will be dumped.
+
+    Args:
+        g1 (Graph): a graph to compare
+        g2 (Graph): the graph to compare with
+
+    """
+    _same_triples = frozenset(g1) == frozenset(g2)
+    if not _same_triples:
+        _dump_diff(g1, g2)
+    assert _same_triples
+
+
+_FIXED_BNODE = BNode("b0")
+
+
+def _fixed_bnode_triples(g: Graph) -> Optional[FrozenSet[Tuple[Node, Node, Node]]]:
+    bnodes = {node for triple in g for node in triple if isinstance(node, BNode)}
+    if len(bnodes) > 1:
+        return None
+
+    def _fixed(node: Node) -> Node:
+        return _FIXED_BNODE if node in bnodes else node
+
+    return frozenset((_fixed(s), _fixed(p), _fixed(o)) for s, p, o in g)
+
+
 def _dump_diff(g1: Graph, g2: Graph) -> None:
-    in_both, in_first, in_second = graph_diff(g1, g2)
+    if _has_bnodes(g1) or _has_bnodes(g2):
+        in_both, in_first, in_second = graph_diff(g1, g2)
+    else:
+        # Without blank nodes the diff is a plain set difference:
+        triples1, triples2 = set(g1), set(g2)
+        in_both = _graph_of(triples1 & triples2)
+        in_first = _graph_of(triples1 - triples2)
+        in_second = _graph_of(triples2 - triples1)
     print("\nin both:")
-    _dump_turtle(in_both)
+    _dump_ntriples(in_both)
     print("\nin first:")
-    _dump_turtle(in_first)
+    _dump_ntriples(in_first)
     print("\nin second:")
-    _dump_turtle(in_second)
+    _dump_ntriples(in_second)
+
+
+def _has_bnodes(g: Graph) -> bool:
+    return any(isinstance(node, BNode) for triple in g for node in triple)
+
+
+def _graph_of(triples: Iterable[Tuple[Node, Node, Node]]) -> Graph:
+    g = Graph(store=SimpleMemory())
+    for triple in triples:
+        g.add(triple)
+    return g
 
 
-def _dump_turtle(g: Graph) -> None:
-    for _l in g.serialize(format="turtle").splitlines():
-        if _l:
-            print(_l)
+def _dump_ntriples(g: Graph) -> None:
+    lines = [_l for _l in g.serialize(format="nt").splitlines() if _l]
+    sys.stdout.write("".join(f"{_l}\n" for _l in lines))